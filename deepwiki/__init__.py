@@ -1,6 +1,24 @@
 # DeepWiki: A tool for creating queryable knowledge bases from code repositories
+#
+# The public classes are imported lazily on attribute access, so that modules
+# such as deepwiki.cli can be imported without loading the RAG and provider stack
 
-from .core import KnowledgeBase, RAG, RAGAnswer, DatabaseManager, SchemaMismatchError
+import importlib
+
+_PUBLIC_MODULES = {
+    "KnowledgeBase": ".knowledge_base",
+    "RAG": ".rag",
+    "RAGAnswer": ".rag",
+    "DatabaseManager": ".data_pipeline",
+    "SchemaMismatchError": ".exceptions",
+}
 
 __version__ = "1.0.0"
-__all__ = ["KnowledgeBase", "RAG", "RAGAnswer", "DatabaseManager", "SchemaMismatchError"]
+__all__ = list(_PUBLIC_MODULES)
+
+
+def __getattr__(name):
+    if name in _PUBLIC_MODULES:
+        module = importlib.import_module(_PUBLIC_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
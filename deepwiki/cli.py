@@ -18,13 +18,87 @@ import argparse
 import logging
 import sys
 import os
-from typing import Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
 
-from deepwiki import KnowledgeBase
-from deepwiki.logging_config import setup_logging
+# KnowledgeBase is imported inside the functions that need it (the deepwiki
+# package exports it lazily), so that --help and argument errors do not pay
+# for loading the RAG and provider stack
+if TYPE_CHECKING:
+    from deepwiki import KnowledgeBase
 
-def parse_arguments():
-    """Parse command line arguments."""
+PROVIDER_CHOICES = ("google", "openai", "openrouter", "ollama", "bedrock", "azure")
+REPO_TYPE_CHOICES = ("github", "gitlab", "bitbucket", "local")
+
+# Interactive commands, matched case-insensitively
+_EXIT_CMDS = frozenset({"exit", "quit", "q"})
+_HELP_CMDS = frozenset({"help", "h", "?"})
+_CLEAR_CMDS = frozenset({"clear", "cls"})
+
+# Number of recent answers interactive_qa_loop keeps for repeated questions
+_QA_CACHE_SIZE = 64
+
+# Options understood by _fast_parse: flags map to True, valued options to
+# their allowed choices (None for any value)
+_FAST_FLAGS = {
+    "--build": "build",
+    "--force-rebuild": "force_rebuild",
+    "--verbose": "verbose",
+    "-v": "verbose",
+    "--quiet": "quiet",
+    "-q": "quiet",
+    "--no-stream": "no_stream",
+}
+_FAST_OPTIONS = {
+    "--provider": ("provider", PROVIDER_CHOICES),
+    "--model": ("model", None),
+    "--type": ("type", REPO_TYPE_CHOICES),
+    "--access-token": ("access_token", None),
+}
+
+def _fast_parse(argv):
+    """
+    Parse the common invocations without building the argparse parser.
+
+    Returns None for anything it does not fully understand (help, list
+    options, abbreviations, invalid values, ...), in which case the full
+    argparse parser must be used.
+    """
+    args = argparse.Namespace(
+        repo_url=None, build=False, force_rebuild=False, provider="google",
+        model=None, type="github", access_token=None, excluded_dirs=None,
+        excluded_files=None, included_dirs=None, included_files=None,
+        verbose=False, quiet=False, no_stream=False,
+    )
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if not arg.startswith("-"):
+            if args.repo_url is not None:
+                return None
+            args.repo_url = arg
+        elif arg in _FAST_FLAGS:
+            setattr(args, _FAST_FLAGS[arg], True)
+        else:
+            name, sep, value = arg.partition("=")
+            if name not in _FAST_OPTIONS:
+                return None
+            if not sep:
+                if i == len(argv) or argv[i].startswith("-"):
+                    return None
+                value = argv[i]
+                i += 1
+            dest, choices = _FAST_OPTIONS[name]
+            if choices is not None and value not in choices:
+                return None
+            setattr(args, dest, value)
+    if args.repo_url is None:
+        return None
+    return args
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full command line argument parser."""
     parser = argparse.ArgumentParser(
         description="DeepWiki - Create queryable knowledge bases from code repositories",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -66,7 +140,7 @@ Examples:
     parser.add_argument(
         "--provider",
         default="google",
-        choices=["google", "openai", "openrouter", "ollama", "bedrock", "azure"],
+        choices=PROVIDER_CHOICES,
         help="AI model provider to use (default: google)"
     )
     
@@ -78,7 +152,7 @@ Examples:
     parser.add_argument(
         "--type",
         default="github",
-        choices=["github", "gitlab", "bitbucket", "local"],
+        choices=REPO_TYPE_CHOICES,
         help="Repository type (default: github)"
     )
     
@@ -129,7 +203,24 @@ Examples:
         help="Disable streaming output (for scripting scenarios)"
     )
     
-    return parser.parse_args()
+    return parser
+
+# Full argument parser, built by _get_parser on first use
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the full argument parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+def parse_arguments():
+    """Parse command line arguments."""
+    args = _fast_parse(sys.argv[1:])
+    if args is not None:
+        return args
+    return _get_parser().parse_args()
 
 def setup_logging_level(verbose: bool, quiet: bool):
     """Set up logging based on verbosity flags."""
@@ -141,83 +232,135 @@ def setup_logging_level(verbose: bool, quiet: bool):
         level = logging.INFO
     
     # Set up logging
+    from deepwiki.logging_config import setup_logging
     setup_logging(level)
 
+_RULE = "=" * 60
+
+# Whether stdout is an interactive terminal, set by interactive_qa_loop;
+# when it is not, the welcome banner is reduced to a plain ASCII line
+_TTY = True
+
+_HELP_TEXT = (
+    "Commands:\n"
+    "  help, h, ?     - Show this help message\n"
+    "  clear, cls     - Clear conversation history\n"
+    "  exit, quit, q  - Exit the application\n"
+    "  Any other text - Ask a question about the repository\n"
+    "\n"
+)
+
 def print_welcome(repo_url: str):
     """Print welcome message."""
-    print("=" * 60)
-    print("🧠 DeepWiki - Interactive Code Repository Q&A")
-    print("=" * 60)
-    print(f"Repository: {repo_url}")
-    print("=" * 60)
-    print()
+    if not _TTY:
+        sys.stdout.write(f"DeepWiki Q&A - Repository: {repo_url}\n\n")
+        sys.stdout.flush()
+        return
+    sys.stdout.write(
+        f"{_RULE}\n"
+        "🧠 DeepWiki - Interactive Code Repository Q&A\n"
+        f"{_RULE}\n"
+        f"Repository: {repo_url}\n"
+        f"{_RULE}\n"
+        "\n"
+    )
+    sys.stdout.flush()
 
 def print_help():
     """Print help message for interactive mode."""
-    print("Commands:")
-    print("  help, h, ?     - Show this help message")
-    print("  clear, cls     - Clear conversation history")
-    print("  exit, quit, q  - Exit the application")
-    print("  Any other text - Ask a question about the repository")
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
+
+def print_answer(answer: str, retrieved_docs):
+    """Print a complete answer and the number of documents it was based on."""
+    print("\n📝 Answer:")
+    print("-" * 40)
+    print(answer)
+    print("-" * 40)
+    
+    # Show retrieved document count
+    if retrieved_docs:
+        print(f"📚 (Based on {len(retrieved_docs)} relevant documents)")
+    
     print()
 
-def interactive_qa_loop(kb: KnowledgeBase, repo_url: str, no_stream: bool = False):
+def interactive_qa_loop(kb: "KnowledgeBase", repo_url: str, no_stream: bool = False):
     """Run the interactive Q&A loop."""
+    global _TTY
+    _TTY = sys.stdout.isatty()
+    if not _TTY and hasattr(sys.stdout, "reconfigure"):
+        # Piped or redirected output does not need flushing on every newline
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print_welcome(repo_url)
     print("💡 Ask questions about the repository. Type 'help' for commands or 'exit' to quit.")
     print()
     
+    # Recent answers keyed by normalized question, least recently used first
+    qa_cache = OrderedDict()
+    
     while True:
+        # Get user input
         try:
-            # Get user input
             user_input = input("❓ Your question: ").strip()
-            
-            # Handle empty input
-            if not user_input:
-                continue
-            
-            # Handle commands
-            if user_input.lower() in ['exit', 'quit', 'q']:
-                print("👋 Goodbye!")
-                break
-            elif user_input.lower() in ['help', 'h', '?']:
-                print_help()
-                continue
-            elif user_input.lower() in ['clear', 'cls']:
-                kb.clear_conversation()
-                print("🧹 Conversation history cleared.")
-                continue
-            
-            # Process the question
-            print("🤔 Thinking...")
-            
+        except (KeyboardInterrupt, EOFError):
+            print("\n\n👋 Goodbye!")
+            break
+        
+        # Handle empty input
+        if not user_input:
+            continue
+        
+        # Handle commands
+        lowered = user_input.lower()
+        if lowered in _EXIT_CMDS:
+            print("👋 Goodbye!")
+            break
+        elif lowered in _HELP_CMDS:
+            print_help()
+            continue
+        elif lowered in _CLEAR_CMDS:
+            kb.clear_conversation()
+            qa_cache.clear()
+            print("🧹 Conversation history cleared.")
+            continue
+        
+        # Repeated questions are answered from the cache without a query;
+        # answers that only report an error are never cached
+        cached = qa_cache.get(lowered)
+        if cached is not None:
+            qa_cache.move_to_end(lowered)
+            answer, retrieved_docs = cached
+            print_answer(answer, retrieved_docs)
+            kb.add_conversation_turn(user_input, answer)
+            continue
+        
+        # Process the question
+        print("🤔 Thinking...")
+        
+        try:
             if no_stream:
                 # Use non-streaming mode
                 answer, retrieved_docs = kb.query(user_input)
                 
                 # Display the answer
-                print("\n📝 Answer:")
-                print("-" * 40)
-                print(answer)
-                print("-" * 40)
-                
-                # Show retrieved document count
-                if retrieved_docs:
-                    print(f"📚 (Based on {len(retrieved_docs)} relevant documents)")
-                
-                print()
+                print_answer(answer, retrieved_docs)
                 
                 # Add to conversation history
                 kb.add_conversation_turn(user_input, answer)
+                if not kb.last_query_failed:
+                    qa_cache[lowered] = (answer, retrieved_docs)
             else:
                 # Use streaming mode
                 print("\n📝 Answer:")
                 print("-" * 40)
                 
-                full_answer = ""
+                chunks = []
                 for chunk in kb.query_stream(user_input):
-                    print(chunk, end='', flush=True)
-                    full_answer += chunk
+                    sys.stdout.write(chunk)
+                    sys.stdout.flush()
+                    chunks.append(chunk)
+                full_answer = "".join(chunks)
                 
                 print()
                 print("-" * 40)
@@ -226,14 +369,16 @@ def interactive_qa_loop(kb: KnowledgeBase, repo_url: str, no_stream: bool = Fals
                 
                 # Add to conversation history
                 kb.add_conversation_turn(user_input, full_answer)
-            
-        except KeyboardInterrupt:
-            print("\n\n👋 Goodbye!")
-            break
-        except Exception as e:
+                if not kb.last_query_failed:
+                    qa_cache[lowered] = (full_answer, None)
+        except (RuntimeError, ConnectionError, TimeoutError) as e:
             print(f"\n❌ Error: {str(e)}")
             print("Please try again or type 'exit' to quit.")
             print()
+            continue
+        
+        if len(qa_cache) > _QA_CACHE_SIZE:
+            qa_cache.popitem(last=False)
 
 def main():
     """Main entry point for the CLI."""
@@ -248,6 +393,7 @@ def main():
         if not args.quiet:
             print(f"🚀 Initializing DeepWiki with {args.provider} provider...")
         
+        from deepwiki import KnowledgeBase
         kb = KnowledgeBase(provider=args.provider, model=args.model)
         
         # Determine if we should build or load
@@ -1,15 +1,17 @@
 import os
+import copy
+import fnmatch
+import importlib
 import logging
 import re
-from typing import List, Union, Dict, Any
+from functools import cache, lru_cache, partial
+from types import MappingProxyType
+from typing import Callable, FrozenSet, List, Mapping, Set, Union, Dict, Any
 
 logger = logging.getLogger(__name__)
 
-from deepwiki.providers.openai_client import OpenAIClient
-from deepwiki.providers.openrouter_client import OpenRouterClient
-from deepwiki.providers.bedrock_client import BedrockClient
-from deepwiki.providers.azureai_client import AzureAIClient
-from adalflow import GoogleGenAIClient, OllamaClient
+# Matches "${ENV_VAR}" placeholders in configuration strings
+_ENV_PLACEHOLDER_RE = re.compile(r"\$\{([A-Z0-9_]+)\}", re.ASCII)
 
 # Get API keys from environment variables
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
@@ -20,34 +22,38 @@ AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
 AWS_REGION = os.environ.get('AWS_REGION')
 AWS_ROLE_ARN = os.environ.get('AWS_ROLE_ARN')
 
-# Set keys in environment (in case they're needed elsewhere in the code)
-if OPENAI_API_KEY:
-    os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
-if GOOGLE_API_KEY:
-    os.environ["GOOGLE_API_KEY"] = GOOGLE_API_KEY
-if OPENROUTER_API_KEY:
-    os.environ["OPENROUTER_API_KEY"] = OPENROUTER_API_KEY
-if AWS_ACCESS_KEY_ID:
-    os.environ["AWS_ACCESS_KEY_ID"] = AWS_ACCESS_KEY_ID
-if AWS_SECRET_ACCESS_KEY:
-    os.environ["AWS_SECRET_ACCESS_KEY"] = AWS_SECRET_ACCESS_KEY
-if AWS_REGION:
-    os.environ["AWS_REGION"] = AWS_REGION
-if AWS_ROLE_ARN:
-    os.environ["AWS_ROLE_ARN"] = AWS_ROLE_ARN
-
-# Client class mapping
-CLIENT_CLASSES = {
-    "GoogleGenAIClient": GoogleGenAIClient,
-    "OpenAIClient": OpenAIClient,
-    "OpenRouterClient": OpenRouterClient,
-    "OllamaClient": OllamaClient,
-    "BedrockClient": BedrockClient,
-    "AzureAIClient": AzureAIClient
-}
-
-# Configuration data (previously in JSON files)
-GENERATOR_CONFIG = {
+@cache
+def _import_client(module_name: str, class_name: str) -> type:
+    """Import a model client class on first use."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+# Client class mapping. Each entry is a zero-argument loader returning the
+# class, so provider SDKs (boto3, azure, openai, ...) are only imported for
+# the providers that are actually used.
+CLIENT_CLASSES: Mapping[str, Callable[[], type]] = MappingProxyType({
+    "GoogleGenAIClient": partial(_import_client, "adalflow", "GoogleGenAIClient"),
+    "OpenAIClient": partial(_import_client, "deepwiki.providers.openai_client", "OpenAIClient"),
+    "OpenRouterClient": partial(_import_client, "deepwiki.providers.openrouter_client", "OpenRouterClient"),
+    "OllamaClient": partial(_import_client, "adalflow", "OllamaClient"),
+    "BedrockClient": partial(_import_client, "deepwiki.providers.bedrock_client", "BedrockClient"),
+    "AzureAIClient": partial(_import_client, "deepwiki.providers.azureai_client", "AzureAIClient")
+})
+
+# Map provider_id to client class
+_PROVIDER_DEFAULTS: Mapping[str, Callable[[], type]] = MappingProxyType({
+    "google": CLIENT_CLASSES["GoogleGenAIClient"],
+    "openai": CLIENT_CLASSES["OpenAIClient"],
+    "openrouter": CLIENT_CLASSES["OpenRouterClient"],
+    "ollama": CLIENT_CLASSES["OllamaClient"],
+    "bedrock": CLIENT_CLASSES["BedrockClient"],
+    "azure": CLIENT_CLASSES["AzureAIClient"]
+})
+
+# Configuration data (previously in JSON files). These are read-only
+# templates; the _build_*_config functions resolve each one once per process
+# and load_*_config return shallow copies, so nested values are shared and
+# must not be modified.
+GENERATOR_CONFIG = MappingProxyType({
     "default_provider": "google",
     "providers": {
         "google": {
@@ -81,9 +87,9 @@ GENERATOR_CONFIG = {
             "top_p": 0.9
         }
     }
-}
+})
 
-EMBEDDER_CONFIG = {
+EMBEDDER_CONFIG = MappingProxyType({
     "embedder": {
         "embedding_model": "text-embedding-3-small",
         "embedding_provider": "openai",
@@ -99,9 +105,9 @@ EMBEDDER_CONFIG = {
         "top_k": 5,
         "similarity_threshold": 0.5
     }
-}
+})
 
-REPO_CONFIG = {
+REPO_CONFIG = MappingProxyType({
     "file_filters": {
         "excluded_dirs": [
             ".git",
@@ -127,16 +133,42 @@ REPO_CONFIG = {
     },
     "max_file_size_mb": 10,
     "max_repo_size_mb": 1000
-}
+})
+
+def _placeholder_containers(config: Any) -> Set[int]:
+    """
+    Return the ids of the dicts and lists in a nested configuration structure
+    that contain a "${...}" placeholder anywhere below them.
+
+    Each container is visited once on the way down and once on the way up, so
+    the cost is linear in the size of the structure.
+    """
+    marked: Set[int] = set()
+    stack = [(config, False)]
+    while stack:
+        value, children_done = stack.pop()
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, list):
+            children = value
+        else:
+            continue
+        if not children_done:
+            stack.append((value, True))
+            stack.extend((child, False) for child in children if isinstance(child, (dict, list)))
+        elif any(id(child) in marked or (isinstance(child, str) and "${" in child) for child in children):
+            marked.add(id(value))
+    return marked
 
 def replace_env_placeholders(config: Union[Dict[str, Any], List[Any], str, Any]) -> Union[Dict[str, Any], List[Any], str, Any]:
     """
-    Recursively replace placeholders like "${ENV_VAR}" in string values
+    Replace placeholders like "${ENV_VAR}" in string values
     within a nested configuration structure (dicts, lists, strings)
     with environment variable values. Logs a warning if a placeholder is not found.
-    """
-    pattern = re.compile(r"\$\{([A-Z0-9_]+)\}")
 
+    Structures without any placeholder are returned unchanged (not copied).
+    The structure is walked iteratively, so arbitrarily deep nesting is safe.
+    """
     def replacer(match: re.Match[str]) -> str:
         env_var_name = match.group(1)
         original_placeholder = match.group(0)
@@ -149,58 +181,85 @@ def replace_env_placeholders(config: Union[Dict[str, Any], List[Any], str, Any])
             return original_placeholder
         return env_var_value
 
-    if isinstance(config, dict):
-        return {k: replace_env_placeholders(v) for k, v in config.items()}
-    elif isinstance(config, list):
-        return [replace_env_placeholders(item) for item in config]
-    elif isinstance(config, str):
-        return pattern.sub(replacer, config)
-    else:
-        # Handles numbers, booleans, None, etc.
+    if isinstance(config, str):
+        if "${" not in config:
+            return config
+        return _ENV_PLACEHOLDER_RE.sub(replacer, config)
+    marked = _placeholder_containers(config)
+    if id(config) not in marked:
         return config
 
+    # Each stack entry is (container, key, value): the substituted value is
+    # stored into container[key], where container is a fresh copy of its
+    # parent. Only branches that contain a placeholder are pushed and copied.
+    root = [config]
+    stack = [(root, 0, config)]
+    while stack:
+        parent, key, value = stack.pop()
+        if isinstance(value, str):
+            parent[key] = _ENV_PLACEHOLDER_RE.sub(replacer, value)
+            continue
+        if isinstance(value, dict):
+            copied = dict(value)
+            children = copied.items()
+        else:
+            copied = list(value)
+            children = enumerate(copied)
+        parent[key] = copied
+        stack.extend(
+            (copied, k, v) for k, v in children
+            if id(v) in marked or (isinstance(v, str) and "${" in v)
+        )
+    return root[0]
+
 # Load generator model configuration
-def load_generator_config():
-    generator_config = replace_env_placeholders(GENERATOR_CONFIG.copy())
+@lru_cache(maxsize=1)
+def _build_generator_config():
+    generator_config = {k: replace_env_placeholders(v) for k, v in GENERATOR_CONFIG.items() if k != "providers"}
 
     # Add client classes to each provider
-    if "providers" in generator_config:
-        for provider_id, provider_config in generator_config["providers"].items():
-            # Map provider_id to client class
-            default_map = {
-                "google": GoogleGenAIClient,
-                "openai": OpenAIClient,
-                "openrouter": OpenRouterClient,
-                "ollama": OllamaClient,
-                "bedrock": BedrockClient,
-                "azure": AzureAIClient
-            }
-            if provider_id in default_map:
-                provider_config["model_client"] = default_map[provider_id]
+    if "providers" in GENERATOR_CONFIG:
+        providers = {}
+        for provider_id, provider_config in GENERATOR_CONFIG["providers"].items():
+            provider_config = replace_env_placeholders(provider_config)
+            if provider_id in _PROVIDER_DEFAULTS:
+                providers[provider_id] = {**provider_config, "model_client": _PROVIDER_DEFAULTS[provider_id]}
             else:
+                providers[provider_id] = provider_config
                 logger.warning(f"Unknown provider: {provider_id}")
+        generator_config["providers"] = providers
 
     return generator_config
 
+def load_generator_config():
+    """Return a shallow copy of the cached generator configuration."""
+    return copy.copy(_build_generator_config())
+
 # Load embedder configuration
-def load_embedder_config():
-    embedder_config = replace_env_placeholders(EMBEDDER_CONFIG.copy())
+@lru_cache(maxsize=1)
+def _build_embedder_config():
+    embedder_config = {k: replace_env_placeholders(v) for k, v in EMBEDDER_CONFIG.items()}
 
     # Process client classes
     for key in ["embedder", "embedder_ollama"]:
         if key in embedder_config and "client_class" in embedder_config[key]:
             class_name = embedder_config[key]["client_class"]
             if class_name in CLIENT_CLASSES:
-                embedder_config[key]["model_client"] = CLIENT_CLASSES[class_name]
+                embedder_config[key] = {**embedder_config[key], "model_client": CLIENT_CLASSES[class_name]}
 
     return embedder_config
 
+def load_embedder_config():
+    """Return a shallow copy of the cached embedder configuration."""
+    return copy.copy(_build_embedder_config())
+
 def get_embedder_config():
     """
     Get the current embedder configuration.
 
     Returns:
-        dict: The embedder configuration with model_client resolved
+        dict: The embedder configuration; model_client is a loader that
+        returns the client class when called
     """
     return configs.get("embedder", {})
 
@@ -215,21 +274,37 @@ def is_ollama_embedder():
     if not embedder_config:
         return False
 
-    # Check if model_client is OllamaClient
+    # Check the client_class string, which avoids importing the client itself
+    client_class = embedder_config.get("client_class")
+    if client_class:
+        return client_class == "OllamaClient"
+
+    # Fallback: resolve model_client and check its class name
     model_client = embedder_config.get("model_client")
     if model_client:
-        return model_client.__name__ == "OllamaClient"
-
-    # Fallback: check client_class string
-    client_class = embedder_config.get("client_class", "")
-    return client_class == "OllamaClient"
+        return model_client().__name__ == "OllamaClient"
+    return False
 
 # Load repository and file filters configuration
+@lru_cache(maxsize=1)
+def _build_repo_config():
+    repo_config = {k: replace_env_placeholders(v) for k, v in REPO_CONFIG.items()}
+
+    # Freeze the file filters for O(1) membership checks
+    if "file_filters" in repo_config:
+        repo_config["file_filters"] = {
+            k: frozenset(v) if k in ("excluded_dirs", "excluded_files") else v
+            for k, v in repo_config["file_filters"].items()
+        }
+
+    return repo_config
+
 def load_repo_config():
-    return replace_env_placeholders(REPO_CONFIG.copy())
+    """Return a shallow copy of the cached repository and file filters configuration."""
+    return copy.copy(_build_repo_config())
 
 # Default excluded directories and files
-DEFAULT_EXCLUDED_DIRS: List[str] = [
+DEFAULT_EXCLUDED_DIRS: FrozenSet[str] = frozenset({
     # Virtual environments and package managers
     "./.venv/", "./venv/", "./env/", "./virtualenv/",
     "./node_modules/", "./bower_components/", "./jspm_packages/",
@@ -245,7 +320,7 @@ DEFAULT_EXCLUDED_DIRS: List[str] = [
     "./.idea/", "./.vscode/", "./.vs/", "./.eclipse/", "./.settings/",
     # Logs and temporary files
     "./logs/", "./log/", "./tmp/", "./temp/",
-]
+})
 
 DEFAULT_EXCLUDED_FILES: List[str] = [
     "yarn.lock", "pnpm-lock.yaml", "npm-shrinkwrap.json", "poetry.lock",
@@ -269,6 +344,45 @@ DEFAULT_EXCLUDED_FILES: List[str] = [
     "packages/*/dist", "packages/*/build", ".output"
 ]
 
+# Precompiled matchers for DEFAULT_EXCLUDED_FILES: a set for literal names and
+# one combined regex for the wildcard patterns
+_EXCLUDED_FILES_EXACT = frozenset(p for p in DEFAULT_EXCLUDED_FILES if not any(c in p for c in "*?["))
+_EXCLUDED_FILES_RE = re.compile("|".join(
+    fnmatch.translate(p) for p in DEFAULT_EXCLUDED_FILES if p not in _EXCLUDED_FILES_EXACT
+))
+
+# Pre-filter for is_excluded_file: a name can only match if its first character
+# starts some literal-prefixed pattern, or its last extension is that of some
+# "*.ext" pattern. Any other wildcard-prefixed pattern disables the bitmap.
+_EXCLUDED_FIRST_CHARS = bytearray(256)
+_excluded_exts = set()
+for _pattern in DEFAULT_EXCLUDED_FILES:
+    if _pattern[0] not in "*?[" and ord(_pattern[0]) < 256:
+        _EXCLUDED_FIRST_CHARS[ord(_pattern[0])] = 1
+    elif _pattern.startswith("*.") and not any(c in _pattern[1:] for c in "*?["):
+        _excluded_exts.add(_pattern.rpartition(".")[2])
+    else:
+        _EXCLUDED_FIRST_CHARS[:] = b"\x01" * 256
+_EXCLUDED_EXTS = frozenset(_excluded_exts)
+del _pattern, _excluded_exts
+
+def is_excluded_file(name: str) -> bool:
+    """
+    Check whether a file name matches any of DEFAULT_EXCLUDED_FILES.
+
+    Parameters:
+        name (str): File name (basename) to check
+
+    Returns:
+        bool: True if the file is excluded by default, False otherwise
+    """
+    if not name:
+        return False
+    first = ord(name[0])
+    if (first > 255 or not _EXCLUDED_FIRST_CHARS[first]) and name.rpartition(".")[2] not in _EXCLUDED_EXTS:
+        return False
+    return name in _EXCLUDED_FILES_EXACT or _EXCLUDED_FILES_RE.match(name) is not None
+
 # Initialize empty configuration
 configs = {}
 
@@ -306,6 +420,17 @@ def get_model_config(provider="google", model=None):
     Returns:
         dict: Configuration containing model_client, model and other parameters
     """
+    cached = _build_model_config(provider, model)
+    # Copy so callers can mutate the result without corrupting the cache
+    return {
+        "model_client": cached["model_client"],
+        "model_kwargs": dict(cached["model_kwargs"]),
+    }
+
+
+@lru_cache(maxsize=32)
+def _build_model_config(provider, model):
+    """Assemble the get_model_config result for a (provider, model) pair."""
     # Get provider configuration
     if "providers" not in configs:
         raise ValueError("Provider configuration not loaded")
@@ -314,9 +439,10 @@ def get_model_config(provider="google", model=None):
     if not provider_config:
         raise ValueError(f"Configuration for provider '{provider}' not found")
 
-    model_client = provider_config.get("model_client")
-    if not model_client:
+    model_client_loader = provider_config.get("model_client")
+    if not model_client_loader:
         raise ValueError(f"Model client not specified for provider '{provider}'")
+    model_client = model_client_loader()
 
     # If model not provided, use default model for the provider
     if not model:
@@ -8,12 +8,13 @@ import tiktoken
 import logging
 import re
 import glob
+from typing import FrozenSet
 from adalflow.utils import get_adalflow_default_root_path
 from adalflow.core.db import LocalDB
-from deepwiki.config import configs, DEFAULT_EXCLUDED_DIRS, DEFAULT_EXCLUDED_FILES
+from deepwiki.config import configs, DEFAULT_EXCLUDED_DIRS, DEFAULT_EXCLUDED_FILES, is_excluded_file
 from deepwiki.ollama_patch import OllamaDocumentProcessor
 from urllib.parse import urlparse, urlunparse
-from .database_versioning import save_state_with_version, load_state_with_version, check_database_version
+from .database_versioning import save_state_with_version, load_state_with_version, check_database_version, read_schema_version
 from .exceptions import SchemaMismatchError
 
 from deepwiki.tools.embedder import get_embedder
@@ -54,6 +55,18 @@ def count_tokens(text: str, is_ollama_embedder: bool = None) -> int:
         # Rough approximation: 4 characters per token
         return len(text) // 4
 
+def _dir_has_entries(path: str) -> bool:
+    """
+    Check whether a directory exists and is not empty.
+
+    Stops at the first entry instead of listing the whole directory.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
 def download_repo(repo_url: str, local_path: str, type: str = "github", access_token: str = None) -> str:
     """
     Downloads a Git repository (GitHub, GitLab, or Bitbucket) to a specified local path.
@@ -77,7 +90,7 @@ def download_repo(repo_url: str, local_path: str, type: str = "github", access_t
         )
 
         # Check if repository already exists
-        if os.path.exists(local_path) and os.listdir(local_path):
+        if _dir_has_entries(local_path):
             # Directory exists and is not empty
             logger.warning(f"Repository already exists at {local_path}. Using existing repository.")
             return f"Using existing repository at {local_path}"
@@ -190,20 +203,21 @@ def read_all_documents(path: str, is_ollama_embedder: bool = None, excluded_dirs
         if excluded_files is not None:
             final_excluded_files.update(excluded_files)
 
-        # Convert back to lists for compatibility
-        excluded_dirs = list(final_excluded_dirs)
-        excluded_files = list(final_excluded_files)
+        # Freeze for O(1) membership checks. Directories are normalized to bare
+        # names so they can be compared against path components directly.
+        excluded_dirs = frozenset(d.strip("./").rstrip("/") for d in final_excluded_dirs)
+        excluded_files = frozenset(final_excluded_files)
         included_dirs = []
         included_files = []
 
         logger.info(f"Using exclusion mode")
-        logger.info(f"Excluded directories: {excluded_dirs}")
-        logger.info(f"Excluded files: {excluded_files}")
+        logger.info(f"Excluded directories: {sorted(excluded_dirs)}")
+        logger.info(f"Excluded files: {sorted(excluded_files)}")
 
     logger.info(f"Reading documents from {path}")
 
     def should_process_file(file_path: str, use_inclusion: bool, included_dirs: List[str], included_files: List[str],
-                           excluded_dirs: List[str], excluded_files: List[str]) -> bool:
+                           excluded_dirs: FrozenSet[str], excluded_files: FrozenSet[str]) -> bool:
         """
         Determine if a file should be processed based on inclusion/exclusion rules.
 
@@ -212,8 +226,8 @@ def read_all_documents(path: str, is_ollama_embedder: bool = None, excluded_dirs
             use_inclusion (bool): Whether to use inclusion mode
             included_dirs (List[str]): List of directories to include
             included_files (List[str]): List of files to include
-            excluded_dirs (List[str]): List of directories to exclude
-            excluded_files (List[str]): List of files to exclude
+            excluded_dirs (FrozenSet[str]): Names of directories to exclude
+            excluded_files (FrozenSet[str]): Names of files to exclude
 
         Returns:
             bool: True if the file should be processed, False otherwise
@@ -253,21 +267,12 @@ def read_all_documents(path: str, is_ollama_embedder: bool = None, excluded_dirs
             return is_included
         else:
             # Exclusion mode: file must not be in excluded directories or match excluded files
-            is_excluded = False
-
             # Check if file is in an excluded directory
-            for excluded in excluded_dirs:
-                clean_excluded = excluded.strip("./").rstrip("/")
-                if clean_excluded in file_path_parts:
-                    is_excluded = True
-                    break
+            is_excluded = not excluded_dirs.isdisjoint(file_path_parts)
 
             # Check if file matches excluded file patterns
             if not is_excluded:
-                for excluded_file in excluded_files:
-                    if file_name == excluded_file:
-                        is_excluded = True
-                        break
+                is_excluded = file_name in excluded_files or is_excluded_file(file_name)
 
             return not is_excluded
 
@@ -411,6 +416,19 @@ def transform_documents_and_save_to_db(
     save_state_with_version(db, db_path)
     return db
 
+def strip_git_suffix(repo_name: str) -> str:
+    """
+    Remove a trailing ".git" from a repository name, keeping any ".git"
+    inside the name (e.g. "my.gitproject").
+
+    Args:
+        repo_name (str): Last path component of a repository URL or path
+
+    Returns:
+        str: Repository name without the ".git" suffix
+    """
+    return repo_name.removesuffix(".git")
+
 # NOTE: Individual file content fetching functions have been removed as they are
 # obsolete in the new workflow that processes entire repositories locally.
 
@@ -465,10 +483,10 @@ class DatabaseManager:
             # GitLab URL format: https://gitlab.com/owner/repo or https://gitlab.com/group/subgroup/repo
             # Bitbucket URL format: https://bitbucket.org/owner/repo
             owner = url_parts[-2]
-            repo = url_parts[-1].replace(".git", "")
+            repo = strip_git_suffix(url_parts[-1])
             repo_name = f"{owner}_{repo}"
         else:
-            repo_name = url_parts[-1].replace(".git", "")
+            repo_name = strip_git_suffix(url_parts[-1])
         return repo_name
 
     def _create_repo(self, repo_url_or_path: str, repo_type: str = "github", access_token: str = None) -> None:
@@ -497,7 +515,7 @@ class DatabaseManager:
                 save_repo_dir = os.path.join(root_path, "repos", repo_name)
 
                 # Check if the repository directory already exists and is not empty
-                if not (os.path.exists(save_repo_dir) and os.listdir(save_repo_dir)):
+                if not _dir_has_entries(save_repo_dir):
                     # Only download if the repository doesn't exist or is empty
                     download_repo(repo_url_or_path, save_repo_dir, repo_type, access_token)
                 else:
@@ -546,6 +564,11 @@ class DatabaseManager:
                 documents = self.db.get_transformed_data(key="split_and_embed")
                 if documents:
                     logger.info(f"Loaded {len(documents)} documents from existing database")
+                    if read_schema_version(self.repo_paths["save_db_file"]) is None:
+                        # Rewrite databases saved before the file header existed, so
+                        # that their schema version can be read without loading them
+                        logger.info("Migrating existing database to the current file format")
+                        save_state_with_version(self.db, self.repo_paths["save_db_file"])
                     return documents
             except SchemaMismatchError as e:
                 logger.warning(f"Database schema mismatch: {e}")
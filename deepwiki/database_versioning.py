@@ -5,17 +5,84 @@ This module provides functionality to handle database schema versioning
 and detect incompatible versions.
 """
 
+import json
 import pickle
+import struct
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, List, Optional
 from .exceptions import SchemaMismatchError
 
+try:
+    import zstandard as zstd
+except ImportError:  # optional: state is stored uncompressed without it
+    zstd = None
+
 logger = logging.getLogger(__name__)
 
 # Database schema version - increment when database structure changes
 CURRENT_SCHEMA_VERSION = "1.0.0"
 
+# Prefix of the framed file format: a small JSON header, then the body, i.e.
+# the pickle payload followed by its out-of-band buffers (PEP 574), which is
+# zstd-compressed when the header says so. Files without the prefix are read
+# as bare pickles.
+_FILE_MAGIC = b"DWDB\x01"
+_HEADER_LENGTH = struct.Struct("<I")
+_LENGTH = struct.Struct("<Q")
+_IO_BUFFER_SIZE = 1 << 20
+_ZSTD_LEVEL = 3
+
+
+def _read_header(f: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Read the JSON header of a framed file.
+
+    Returns None (with the file rewound) if the file has no header.
+    """
+    if f.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+        f.seek(0)
+        return None
+    (header_size,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+    return json.loads(f.read(header_size))
+
+
+def _read_exact(f: BinaryIO, size: int) -> bytearray:
+    """Read exactly size bytes; stream readers may return short reads."""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    offset = 0
+    while offset < size:
+        count = f.readinto(view[offset:])
+        if not count:
+            raise EOFError("Unexpected end of database file")
+        offset += count
+    return buffer
+
+
+def _write_body(f: BinaryIO, payload: bytes, buffers: List[pickle.PickleBuffer]) -> None:
+    """Write a pickle payload and its out-of-band buffers."""
+    f.write(_LENGTH.pack(len(payload)))
+    f.write(payload)
+    f.write(_LENGTH.pack(len(buffers)))
+    for buffer in buffers:
+        view = buffer.raw()
+        f.write(_LENGTH.pack(view.nbytes))
+        f.write(view)
+
+
+def _read_body(f: BinaryIO) -> Any:
+    """Read a pickle payload and its out-of-band buffers."""
+    (payload_size,) = _LENGTH.unpack(_read_exact(f, _LENGTH.size))
+    payload = _read_exact(f, payload_size)
+    (buffer_count,) = _LENGTH.unpack(_read_exact(f, _LENGTH.size))
+    buffers = []
+    for _ in range(buffer_count):
+        (buffer_size,) = _LENGTH.unpack(_read_exact(f, _LENGTH.size))
+        # Writable buffers so that e.g. numpy arrays are not loaded read-only
+        buffers.append(_read_exact(f, buffer_size))
+    return pickle.loads(payload, buffers=buffers)
+
 
 def save_state_with_version(obj: Any, filepath: str) -> None:
     """
@@ -31,9 +98,25 @@ def save_state_with_version(obj: Any, filepath: str) -> None:
     }
     
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(filepath, 'wb') as f:
-        pickle.dump(versioned_data, f)
+
+    # Large contiguous buffers (e.g. numpy embeddings) are written out-of-band
+    # instead of being copied into the pickle stream
+    buffers = []
+    payload = pickle.dumps(versioned_data, protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=buffers.append)
+
+    compression = "zstd" if zstd is not None else None
+    header = json.dumps({"schema_version": CURRENT_SCHEMA_VERSION, "compression": compression}).encode("utf-8")
+
+    with open(filepath, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+        f.write(_FILE_MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        if compression == "zstd":
+            cctx = zstd.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+            with cctx.stream_writer(f, closefd=False) as writer:
+                _write_body(writer, payload, buffers)
+        else:
+            _write_body(f, payload, buffers)
     
     logger.debug(f"Saved state with schema version {CURRENT_SCHEMA_VERSION} to {filepath}")
 
@@ -55,8 +138,30 @@ def load_state_with_version(filepath: str) -> Any:
     if not Path(filepath).exists():
         raise FileNotFoundError(f"Database file not found: {filepath}")
     
-    with open(filepath, 'rb') as f:
-        data = pickle.load(f)
+    with open(filepath, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        header = _read_header(f)
+        if header is None:
+            # Bare pickle written by older versions
+            data = pickle.load(f)
+        else:
+            # Reject mismatched versions before unpickling the payload
+            found_version = header.get("schema_version", "unknown")
+            if found_version != CURRENT_SCHEMA_VERSION:
+                logger.error(f"Schema version mismatch in {filepath}")
+                raise SchemaMismatchError(found_version, CURRENT_SCHEMA_VERSION)
+
+            compression = header.get("compression")
+            if compression == "zstd":
+                if zstd is None:
+                    raise ImportError(
+                        f"Database file {filepath} is zstd-compressed; install 'zstandard' to load it"
+                    )
+                with zstd.ZstdDecompressor().stream_reader(f, closefd=False) as reader:
+                    data = _read_body(reader)
+            elif compression is None:
+                data = _read_body(f)
+            else:
+                raise ValueError(f"Unsupported compression '{compression}' in {filepath}")
     
     # Handle old format without versioning
     if not isinstance(data, dict) or "schema_version" not in data:
@@ -72,6 +177,26 @@ def load_state_with_version(filepath: str) -> Any:
     return data["data"]
 
 
+def read_schema_version(filepath: str) -> Optional[str]:
+    """
+    Read the schema version from a database file header without loading its data.
+    
+    Args:
+        filepath: Path to the database file
+        
+    Returns:
+        The schema version, or None if the file was written without a header
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    with open(filepath, 'rb') as f:
+        header = _read_header(f)
+    if header is None:
+        return None
+    return header.get("schema_version", "unknown")
+
+
 def check_database_version(filepath: str) -> bool:
     """
     Check if a database file has a compatible schema version.
@@ -82,6 +207,15 @@ def check_database_version(filepath: str) -> bool:
     Returns:
         True if compatible, False otherwise
     """
+    try:
+        found_version = read_schema_version(filepath)
+    except FileNotFoundError:
+        return False
+
+    if found_version is not None:
+        return found_version == CURRENT_SCHEMA_VERSION
+
+    # Files without a header carry the version inside the pickle only
     try:
         load_state_with_version(filepath)
         return True
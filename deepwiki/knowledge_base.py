@@ -7,15 +7,27 @@ from code repositories.
 
 import logging
 import os
+import re
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+from adalflow.utils import get_adalflow_default_root_path
+
 from .rag import RAG, RAGAnswer
-from .data_pipeline import DatabaseManager
+from .data_pipeline import DatabaseManager, strip_git_suffix
+from .database_versioning import CURRENT_SCHEMA_VERSION, read_schema_version
 
 logger = logging.getLogger(__name__)
 
+# Captures the first two path components (owner, repo) of a repository URL,
+# after an optional "scheme://host/" or scp-style "user@host:" prefix; the
+# repo name still carries any ".git" suffix for strip_git_suffix to remove
+_REPO_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*://[^/]*/|[^/:@]+@[^/:]+:)?/*([^/?#]+)/([^/?#]+)(?:[/?#]|$)")
+
+# adalflow root directory, resolved on first use
+_ADALFLOW_ROOT: Optional[str] = None
+
 
 class KnowledgeBase:
     """
@@ -41,6 +53,13 @@ class KnowledgeBase:
         self.rag = RAG(provider=provider, model=model)
         self.repo_url_or_path = None
         self.is_ready = False
+        # Whether the last query or query_stream answered with an error message
+        self.last_query_failed = False
+        # Memoized results of _extract_repo_identifier and _get_database_path
+        self._repo_identifier_cache: Dict[str, str] = {}
+        self._database_path_cache: Dict[str, str] = {}
+        # Memoized results of _database_exists, invalidated by build()
+        self._database_exists_cache: Dict[str, bool] = {}
         
     def _extract_repo_identifier(self, repo_url_or_path: str) -> str:
         """
@@ -52,20 +71,28 @@ class KnowledgeBase:
         Returns:
             Unique identifier for the repository
         """
+        repo_identifier = self._repo_identifier_cache.get(repo_url_or_path)
+        if repo_identifier is None:
+            repo_identifier = self._compute_repo_identifier(repo_url_or_path)
+            self._repo_identifier_cache[repo_url_or_path] = repo_identifier
+        return repo_identifier
+
+    def _compute_repo_identifier(self, repo_url_or_path: str) -> str:
+        """Compute the identifier returned by _extract_repo_identifier."""
         if os.path.isdir(repo_url_or_path):
             # Local path - use directory name
             return Path(repo_url_or_path).name
         else:
             # URL - extract owner/repo format
+            match = _REPO_RE.match(repo_url_or_path)
+            if match:
+                return f"{match.group(1)}_{strip_git_suffix(match.group(2))}"
+
             parsed = urlparse(repo_url_or_path)
             path_parts = parsed.path.strip('/').split('/')
-            if len(path_parts) >= 2:
-                owner, repo = path_parts[0], path_parts[1]
+            if len(path_parts) == 1:
                 # Remove .git suffix if present
-                repo = repo.replace('.git', '')
-                return f"{owner}_{repo}"
-            elif len(path_parts) == 1:
-                repo = path_parts[0].replace('.git', '')
+                repo = strip_git_suffix(path_parts[0])
                 return repo
             else:
                 # Fallback to last part of URL
@@ -79,14 +106,20 @@ class KnowledgeBase:
             repo_identifier: Unique identifier for the repository
             
         Returns:
-            Path to the database directory
+            Path to the database file
         """
-        from adalflow.utils import get_adalflow_default_root_path
-        return os.path.join(get_adalflow_default_root_path(), "databases", repo_identifier)
+        global _ADALFLOW_ROOT
+        db_path = self._database_path_cache.get(repo_identifier)
+        if db_path is None:
+            if _ADALFLOW_ROOT is None:
+                _ADALFLOW_ROOT = get_adalflow_default_root_path()
+            db_path = os.path.join(_ADALFLOW_ROOT, "databases", f"{repo_identifier}.pkl")
+            self._database_path_cache[repo_identifier] = db_path
+        return db_path
     
     def _database_exists(self, repo_identifier: str) -> bool:
         """
-        Check if a database already exists for the repository.
+        Check if a completely built database exists for the repository.
         
         Args:
             repo_identifier: Unique identifier for the repository
@@ -94,8 +127,31 @@ class KnowledgeBase:
         Returns:
             True if database exists, False otherwise
         """
-        db_path = self._get_database_path(repo_identifier)
-        return os.path.exists(db_path) and os.listdir(db_path)
+        exists = self._database_exists_cache.get(repo_identifier)
+        if exists is None:
+            # The ready marker proves the build completed and records the
+            # database file it wrote; the header probe that this file is still
+            # present and of the current schema
+            try:
+                with open(self._get_ready_sentinel_path(repo_identifier)) as f:
+                    db_file = f.read() or self._get_database_path(repo_identifier)
+                exists = read_schema_version(db_file) == CURRENT_SCHEMA_VERSION
+            except (OSError, ValueError):
+                exists = False
+            self._database_exists_cache[repo_identifier] = exists
+        return exists
+
+    def _get_ready_sentinel_path(self, repo_identifier: str) -> str:
+        """
+        Get the path of the marker file written once a database build completes.
+        
+        Args:
+            repo_identifier: Unique identifier for the repository
+            
+        Returns:
+            Path to the ready marker file
+        """
+        return f"{self._get_database_path(repo_identifier)}.ready"
     
     def build(self, repo_url_or_path: str, 
               repo_type: str = "github",
@@ -132,6 +188,12 @@ class KnowledgeBase:
             
             logger.info(f"Building knowledge base for {repo_url_or_path}")
             
+            # The knowledge base is only marked ready again once the build
+            # completes, so the cached existence check no longer applies
+            sentinel_path = Path(self._get_ready_sentinel_path(repo_identifier))
+            sentinel_path.unlink(missing_ok=True)
+            self._database_exists_cache.pop(repo_identifier, None)
+            
             # Prepare the retriever (this will build the database)
             self.rag.prepare_retriever(
                 repo_url_or_path=repo_url_or_path,
@@ -143,6 +205,10 @@ class KnowledgeBase:
                 included_files=included_files
             )
             
+            # The database manager names the database file on its own (e.g.
+            # subgroup_repo for GitLab subgroups), so the marker records it
+            sentinel_path.write_text(self.rag.db_manager.repo_paths["save_db_file"])
+            
             self.is_ready = True
             logger.info("Knowledge base built successfully")
             return True
@@ -217,6 +283,7 @@ class KnowledgeBase:
         if not self.is_ready:
             raise RuntimeError("Knowledge base is not ready. Call build() or load() first.")
         
+        self.last_query_failed = False
         try:
             result = self.rag.call(question, language)
             
@@ -231,6 +298,7 @@ class KnowledgeBase:
                 
         except Exception as e:
             logger.error(f"Error querying knowledge base: {str(e)}")
+            self.last_query_failed = True
             return f"I apologize, but I encountered an error while processing your question: {str(e)}", []
     
     def add_conversation_turn(self, question: str, answer: str) -> bool:
@@ -272,10 +340,12 @@ class KnowledgeBase:
         if not self.is_ready:
             raise RuntimeError("Knowledge base is not ready. Call build() or load() first.")
             
+        self.last_query_failed = False
         try:
             for chunk in self.rag.call_stream(question, language):
                 yield chunk
                 
         except Exception as e:
             logger.error(f"Error during streaming query: {str(e)}")
+            self.last_query_failed = True
             yield f"I apologize, but I encountered an error: {str(e)}" 
\ No newline at end of file
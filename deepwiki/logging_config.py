@@ -1,37 +1,63 @@
 import logging
 import os
+from functools import cache
 from pathlib import Path
+from typing import Optional
+
+# Log file the root logger is currently configured for by setup_logging
+_configured_log_file: Optional[Path] = None
+
+
+@cache
+def _get_log_dir() -> Path:
+    """Return the resolved project logs directory, creating it on first use."""
+    log_dir = Path(__file__).parent / "logs"
+    if not log_dir.exists():
+        log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir.resolve()
+
+
+@cache
+def _resolve_log_file(log_file: str) -> Path:
+    """Resolve and validate a log file path, creating its parent directory."""
+    log_dir_resolved = _get_log_dir()
+    log_file_path = Path(log_file)
+
+    # ensure log_file_path is within the project's logs directory to prevent path traversal
+    resolved_path = log_file_path.resolve()
+    if not str(resolved_path).startswith(str(log_dir_resolved) + os.sep):
+        raise ValueError(
+            f"LOG_FILE_PATH '{log_file_path}' is outside the trusted log directory '{log_dir_resolved}'"
+        )
+    # Ensure parent dirs exist for the log file
+    if not resolved_path.parent.exists():
+        resolved_path.parent.mkdir(parents=True, exist_ok=True)
+    return resolved_path
 
 
 def setup_logging(level: int = logging.INFO):
     """
     Configure logging for the application.
-    
+
+    Repeated calls for the same log file only update the log level.
+
     Args:
         level: Logging level (e.g., logging.DEBUG, logging.INFO, logging.WARNING)
     """
-    # Determine log directory and default file path
-    base_dir = Path(__file__).parent
-    log_dir = base_dir / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    default_log_file = log_dir / "application.log"
+    global _configured_log_file
 
     # Get log level and file path from environment (with fallback to parameter)
     log_level_str = os.environ.get("LOG_LEVEL", "").upper()
     if log_level_str:
         level = getattr(logging, log_level_str, level)
-    
-    log_file_path = Path(os.environ.get("LOG_FILE_PATH", str(default_log_file)))
 
-    # ensure log_file_path is within the project's logs directory to prevent path traversal
-    log_dir_resolved = log_dir.resolve()
-    resolved_path = log_file_path.resolve()
-    if not str(resolved_path).startswith(str(log_dir_resolved) + os.sep):
-        raise ValueError(
-            f"LOG_FILE_PATH '{log_file_path}' is outside the trusted log directory '{log_dir_resolved}'"
-        )
-    # Ensure parent dirs exist for the log file
-    resolved_path.parent.mkdir(parents=True, exist_ok=True)
+    default_log_file = _get_log_dir() / "application.log"
+    resolved_path = _resolve_log_file(os.environ.get("LOG_FILE_PATH", str(default_log_file)))
+
+    root_logger = logging.getLogger()
+    if resolved_path == _configured_log_file and root_logger.handlers:
+        root_logger.setLevel(level)
+        return
 
     # Configure logging handlers and format
     logging.basicConfig(
@@ -43,6 +69,7 @@ def setup_logging(level: int = logging.INFO):
         ],
         force=True
     )
+    _configured_log_file = resolved_path
 
     # Initial debug message to confirm configuration
     logger = logging.getLogger(__name__)
@@ -2,13 +2,24 @@
 Provider modules for DeepWiki.
 
 This package contains provider-specific implementations for various AI services.
+Client classes are imported lazily on attribute access, so importing one
+provider does not pull in the SDKs of all the others.
 """
 
-from .azureai_client import *
-from .bedrock_client import *
-from .openai_client import *
-from .openrouter_client import *
+import importlib
 
-__all__ = [
-    # This will be populated with the actual exports from the client modules
-] 
\ No newline at end of file
+_CLIENT_MODULES = {
+    "AzureAIClient": ".azureai_client",
+    "BedrockClient": ".bedrock_client",
+    "OpenAIClient": ".openai_client",
+    "OpenRouterClient": ".openrouter_client",
+}
+
+__all__ = list(_CLIENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _CLIENT_MODULES:
+        module = importlib.import_module(_CLIENT_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,7 +11,7 @@ def get_embedder() -> adal.Embedder:
     embedder_config = configs["embedder"]
 
     # --- Initialize Embedder ---
-    model_client_class = embedder_config["model_client"]
+    model_client_class = embedder_config["model_client"]()
     if "initialize_kwargs" in embedder_config:
         model_client = model_client_class(**embedder_config["initialize_kwargs"])
     else:
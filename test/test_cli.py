@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for the DeepWiki command line interface.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from deepwiki import cli
+
+
+def parse_with_argparse(argv):
+    """Parse argv with the full argparse parser, bypassing the fast path."""
+    with patch.object(cli, "_fast_parse", return_value=None), \
+         patch("sys.argv", ["deepwiki", *argv]):
+        return cli.parse_arguments()
+
+
+class TestFastParse:
+    """Tests for the _fast_parse argument scanner"""
+    
+    @pytest.mark.parametrize("argv", [
+        ["https://github.com/owner/repo"],
+        ["https://github.com/owner/repo", "--build"],
+        ["/path/to/repo", "--build", "--provider=openai", "--type=local"],
+        ["--force-rebuild", "https://github.com/owner/repo", "-v", "--no-stream"],
+        ["https://github.com/owner/repo", "--provider", "ollama", "--model", "llama3.2"],
+        ["https://github.com/owner/repo", "--access-token=secret", "-q"],
+        ["https://github.com/owner/repo", "--model="],
+    ])
+    def test_matches_argparse(self, argv):
+        """Test that the fast path produces the same namespace as argparse."""
+        fast_args = cli._fast_parse(argv)
+        assert fast_args is not None
+        assert vars(fast_args) == vars(parse_with_argparse(argv))
+    
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["--help"],
+        ["https://github.com/owner/repo", "-h"],
+        ["https://github.com/owner/repo", "--excluded-dirs", "docs"],
+        ["https://github.com/owner/repo", "--provider=unknown"],
+        ["https://github.com/owner/repo", "--prov=openai"],
+        ["https://github.com/owner/repo", "--model"],
+        ["https://github.com/owner/repo", "https://github.com/other/repo"],
+    ])
+    def test_falls_back_to_argparse(self, argv):
+        """Test that anything unusual is left to argparse."""
+        assert cli._fast_parse(argv) is None
+
+
+class TestParseArguments:
+    """Tests for the full argparse parser"""
+    
+    def test_parser_is_built_once(self):
+        """Test that the argparse parser is cached after the first build."""
+        with patch.object(cli, "_PARSER", None), \
+             patch.object(cli, "_build_parser", wraps=cli._build_parser) as build:
+            assert cli._get_parser() is cli._get_parser()
+            build.assert_called_once()
+    
+    def test_import_does_not_load_knowledge_base(self):
+        """Test that importing the CLI leaves the RAG and provider stack unloaded."""
+        code = "import sys, deepwiki.cli; print('deepwiki.knowledge_base' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+
+class TestInteractiveQALoop:
+    """Tests for the interactive Q&A loop"""
+    
+    def test_repeated_question_uses_cache(self, capsys):
+        """Test that re-asking a question does not query the knowledge base again."""
+        kb = MagicMock(last_query_failed=False)
+        kb.query.return_value = ("It says hello.", ["doc"])
+        
+        inputs = ["What does it do?", "  what does it DO?  ", "exit"]
+        with patch("builtins.input", side_effect=inputs):
+            cli.interactive_qa_loop(kb, "https://github.com/owner/repo", no_stream=True)
+        
+        kb.query.assert_called_once_with("What does it do?")
+        assert kb.add_conversation_turn.call_count == 2
+        assert capsys.readouterr().out.count("It says hello.") == 2
+    
+    def test_streamed_answer_is_recorded(self, capsys):
+        """Test that streamed chunks are echoed and joined into the history turn."""
+        kb = MagicMock()
+        kb.query_stream.return_value = iter(["It says ", "hello."])
+        
+        with patch("builtins.input", side_effect=["What does it do?", "exit"]):
+            cli.interactive_qa_loop(kb, "https://github.com/owner/repo")
+        
+        kb.add_conversation_turn.assert_called_once_with("What does it do?", "It says hello.")
+        assert "It says hello." in capsys.readouterr().out
+    
+    def test_plain_banner_when_not_a_tty(self, capsys):
+        """Test that redirected output gets a plain ASCII header instead of the banner."""
+        with patch("builtins.input", side_effect=["exit"]), \
+             patch.object(cli, "_TTY", True):
+            cli.interactive_qa_loop(MagicMock(), "https://github.com/owner/repo")
+        
+        out = capsys.readouterr().out
+        assert out.startswith("DeepWiki Q&A - Repository: https://github.com/owner/repo\n")
+        assert "=" * 60 not in out
+    
+    def test_query_error_keeps_loop_running(self, capsys):
+        """Test that a failed query is reported and the loop asks again."""
+        kb = MagicMock()
+        kb.query.side_effect = [RuntimeError("Knowledge base is not ready."), ("It says hello.", [])]
+        
+        inputs = ["What does it do?", "What does it do?", "exit"]
+        with patch("builtins.input", side_effect=inputs):
+            cli.interactive_qa_loop(kb, "https://github.com/owner/repo", no_stream=True)
+        
+        out = capsys.readouterr().out
+        assert "❌ Error: Knowledge base is not ready." in out
+        assert "It says hello." in out
+        kb.add_conversation_turn.assert_called_once_with("What does it do?", "It says hello.")
+    
+    def test_end_of_input_exits(self, capsys):
+        """Test that end of input (Ctrl-D) leaves the loop."""
+        with patch("builtins.input", side_effect=EOFError):
+            cli.interactive_qa_loop(MagicMock(), "https://github.com/owner/repo")
+        
+        assert "Goodbye!" in capsys.readouterr().out
+    
+    def test_failed_answer_is_not_cached(self):
+        """Test that re-asking after an error message queries the knowledge base again."""
+        kb = MagicMock()
+        answers = iter([
+            (True, ("I apologize, but I encountered an error while processing your question: rate limited", [])),
+            (False, ("It says hello.", ["doc"])),
+        ])
+        
+        def query(question):
+            kb.last_query_failed, result = next(answers)
+            return result
+        
+        kb.query.side_effect = query
+        inputs = ["What does it do?", "What does it do?", "What does it do?", "exit"]
+        with patch("builtins.input", side_effect=inputs):
+            cli.interactive_qa_loop(kb, "https://github.com/owner/repo", no_stream=True)
+        
+        assert kb.query.call_count == 2
+        assert kb.add_conversation_turn.call_count == 3
+    
+    def test_clear_drops_cached_answers(self):
+        """Test that clearing the conversation also clears cached answers."""
+        kb = MagicMock(last_query_failed=False)
+        kb.query.return_value = ("It says hello.", [])
+        
+        inputs = ["What does it do?", "clear", "What does it do?", "exit"]
+        with patch("builtins.input", side_effect=inputs):
+            cli.interactive_qa_loop(kb, "https://github.com/owner/repo", no_stream=True)
+        
+        assert kb.query.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
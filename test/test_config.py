@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the DeepWiki configuration helpers.
+"""
+
+import fnmatch
+
+import pytest
+
+from deepwiki.config import DEFAULT_EXCLUDED_FILES, is_excluded_file, replace_env_placeholders
+
+
+def candidate_names():
+    """Build a fixed set of names around each default pattern and some ordinary files."""
+    names = {
+        "main.py", "README.md", "index.ts", "Makefile", "Dockerfile", ".bashrc",
+        "x", ".", "..", "a.b.c", "ünïcode.pyc", "日本.js", "€.ini", "name.", ".hidden.min.js",
+    }
+    for pattern in DEFAULT_EXCLUDED_FILES:
+        for filler in ("", "x", "app", ".", "a.b"):
+            name = pattern.replace("*", filler)
+            names.update({
+                name, name.upper(), name.capitalize(), name[1:], name[:-1],
+                f"a{name}", f"{name}x", f"{name}.bak", f".{name}", f"_{name}",
+            })
+    names.discard("")
+    return sorted(names)
+
+
+class TestIsExcludedFile:
+    """Tests for matching file names against DEFAULT_EXCLUDED_FILES"""
+    
+    @pytest.mark.parametrize("name", [
+        # Literal names
+        "yarn.lock", "pyproject.toml", ".DS_Store", ".env", ".gitignore",
+        # "*.ext" patterns
+        "module.pyc", "setup.cfg", "tox.ini", "app.min.js", "styles.min.css", "archive.tar",
+        # ".env.*" and "*.env" patterns
+        ".env.local", ".env.production", "docker.env",
+    ])
+    def test_excluded(self, name):
+        """Test that default literal and wildcard patterns are excluded."""
+        assert is_excluded_file(name)
+    
+    @pytest.mark.parametrize("name", [
+        "main.py", "README.md", "app.js", "index.ts", "config.yaml", "package.json",
+        # Matching is case-sensitive, like fnmatch.fnmatchcase
+        "Foo.PYC", "SETUP.CFG", "Yarn.lock",
+        # Only whole names match
+        "my.env.example", "pyproject.toml.bak", "",
+    ])
+    def test_not_excluded(self, name):
+        """Test that ordinary source and documentation files are kept."""
+        assert not is_excluded_file(name)
+    
+    def test_matches_fnmatchcase(self):
+        """Test that the precompiled matcher and its pre-filter agree with fnmatch.fnmatchcase."""
+        mismatches = [
+            name for name in candidate_names()
+            if is_excluded_file(name) != any(fnmatch.fnmatchcase(name, p) for p in DEFAULT_EXCLUDED_FILES)
+        ]
+        assert not mismatches
+
+
+
+class TestReplaceEnvPlaceholders:
+    """Tests for environment placeholder substitution in configurations"""
+    
+    def test_substitutes_and_keeps_unchanged_branches(self, monkeypatch):
+        """Test that only branches containing placeholders are copied."""
+        monkeypatch.setenv("DEEPWIKI_TEST_KEY", "secret")
+        static = {"top_k": 5, "names": ["a", "b"]}
+        config = {"client": {"api_key": "${DEEPWIKI_TEST_KEY}", "hosts": ["x", "${DEEPWIKI_TEST_KEY}"]}, "static": static}
+        
+        result = replace_env_placeholders(config)
+        
+        assert result == {"client": {"api_key": "secret", "hosts": ["x", "secret"]}, "static": static}
+        assert result["static"] is static
+        assert config["client"]["api_key"] == "${DEEPWIKI_TEST_KEY}", "Input should not be modified"
+        assert replace_env_placeholders(static) is static
+    
+    def test_deeply_nested_config(self, monkeypatch):
+        """Test that very deep nesting neither recurses nor re-scans subtrees per level."""
+        monkeypatch.setenv("DEEPWIKI_TEST_KEY", "secret")
+        depth = 50000
+        config = "${DEEPWIKI_TEST_KEY}"
+        for _ in range(depth):
+            config = {"child": config, "static": {"a": 1}}
+        
+        result = replace_env_placeholders(config)
+        
+        node = result
+        for _ in range(depth):
+            node = node["child"]
+        assert node == "secret"
+        assert result["static"] is config["static"]
+    
+    def test_string_without_placeholder_skips_regex(self, monkeypatch):
+        """Test that strings without "${" are returned without running the regex."""
+        monkeypatch.setattr("deepwiki.config._ENV_PLACEHOLDER_RE", None)
+        assert replace_env_placeholders("gpt-4o") == "gpt-4o"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the DeepWiki data pipeline.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+
+import pytest
+from unittest.mock import patch
+
+from deepwiki.data_pipeline import DatabaseManager, read_all_documents
+from deepwiki.database_versioning import CURRENT_SCHEMA_VERSION, read_schema_version
+
+
+@pytest.fixture
+def repo_dir():
+    """Create a small repository tree with a mix of kept and excluded files."""
+    root = tempfile.mkdtemp()
+    for name in ["main.py", "app.js", "app.min.js", "tsconfig.json", "README.md", "notes.txt"]:
+        with open(os.path.join(root, name), "w") as f:
+            f.write("content")
+    os.makedirs(os.path.join(root, "node_modules"))
+    with open(os.path.join(root, "node_modules", "lib.js"), "w") as f:
+        f.write("content")
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+class FakeDB:
+    """Picklable stand-in for a LocalDB holding transformed documents."""
+    
+    def __init__(self, documents):
+        self.documents = documents
+    
+    def get_transformed_data(self, key):
+        return self.documents
+
+
+def read_file_names(monkeypatch, path, **kwargs):
+    """Return the sorted relative paths of the documents read from path."""
+    # Read relative to the repository root: excluded directory names are
+    # matched against every path component, and temp dirs live under "tmp"
+    monkeypatch.chdir(path)
+    with patch("deepwiki.data_pipeline.count_tokens", return_value=1):
+        documents = read_all_documents(".", is_ollama_embedder=False, **kwargs)
+    return sorted(doc.meta_data["file_path"] for doc in documents)
+
+
+class TestReadAllDocumentsExclusion:
+    """Tests for the exclusion mode of read_all_documents"""
+    
+    def test_default_exclusions(self, monkeypatch, repo_dir):
+        """Test that default literal and wildcard file patterns and directories are excluded."""
+        assert read_file_names(monkeypatch, repo_dir) == ["README.md", "app.js", "main.py", "notes.txt"]
+    
+    def test_caller_excluded_files_match_exact_names(self, monkeypatch, repo_dir):
+        """Test that caller-supplied excluded_files are compared as literal names only."""
+        names = read_file_names(monkeypatch, repo_dir, excluded_files=["*.md", "app.js"])
+        assert names == ["README.md", "main.py", "notes.txt"]
+
+
+class TestDatabaseManagerMigration:
+    """Tests for loading databases saved by older versions"""
+    
+    def test_headerless_database_is_rewritten(self, repo_dir):
+        """Test that a database without a file header is loaded and saved in the current format."""
+        db_file = os.path.join(repo_dir, "owner_repo.pkl")
+        with open(db_file, "wb") as f:
+            pickle.dump({"schema_version": CURRENT_SCHEMA_VERSION, "data": FakeDB(["doc"])}, f)
+        assert read_schema_version(db_file) is None
+        
+        manager = DatabaseManager()
+        manager.repo_paths = {"save_repo_dir": repo_dir, "save_db_file": db_file}
+        with patch("deepwiki.data_pipeline.transform_documents_and_save_to_db") as mock_save:
+            assert manager.prepare_db_index(is_ollama_embedder=False) == ["doc"]
+        
+        mock_save.assert_not_called()
+        assert read_schema_version(db_file) == CURRENT_SCHEMA_VERSION
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
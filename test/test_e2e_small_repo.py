@@ -8,6 +8,7 @@ This test validates the complete workflow:
 4. Test with streaming disabled for speed
 """
 
+import functools
 import pytest
 import tempfile
 import shutil
@@ -37,8 +38,17 @@ def temp_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@functools.lru_cache(maxsize=1)
 def test_internet_connectivity():
-    """Check if internet is available for the test."""
+    """
+    Check if internet is available for the test.
+    
+    The result is cached so the probe runs once per session; set
+    DEEPWIKI_SKIP_NET_CHECK=1 to skip it and assume connectivity.
+    """
+    if os.environ.get("DEEPWIKI_SKIP_NET_CHECK") == "1":
+        return True
+    
     import requests
     try:
         response = requests.get("https://github.com", timeout=5)
@@ -155,6 +165,7 @@ def test_schema_versioning():
         save_state_with_version, 
         load_state_with_version, 
         check_database_version,
+        read_schema_version,
         CURRENT_SCHEMA_VERSION
     )
     from deepwiki.exceptions import SchemaMismatchError
@@ -176,12 +187,16 @@ def test_schema_versioning():
         
         # Test version checking
         assert check_database_version(filepath), "Version check should pass for current version"
+        assert read_schema_version(filepath) == CURRENT_SCHEMA_VERSION, "Header should carry the schema version"
         
         # Test loading old format (simulate by saving without version)
         import pickle
         with open(filepath, 'wb') as f:
             pickle.dump(test_data, f)  # Save without version wrapper
         
+        assert read_schema_version(filepath) is None, "Old format has no header"
+        assert not check_database_version(filepath), "Version check should fail for old format"
+        
         # Should raise SchemaMismatchError for old format
         with pytest.raises(SchemaMismatchError) as exc_info:
             load_state_with_version(filepath)
@@ -195,20 +210,49 @@ def test_schema_versioning():
             os.unlink(filepath)
 
 
-def test_logging_simplification():
+def test_schema_versioning_numpy_buffers():
+    """
+    Test that numpy arrays survive the out-of-band buffer save/load cycle.
+    """
+    import numpy as np
+    from deepwiki.database_versioning import save_state_with_version, load_state_with_version
+
+    test_data = {"vectors": [np.arange(8, dtype=np.float32), np.ones((2, 3))], "text": "chunk"}
+
+    with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as f:
+        filepath = f.name
+
+    try:
+        save_state_with_version(test_data, filepath)
+        loaded_data = load_state_with_version(filepath)
+
+        assert loaded_data["text"] == "chunk"
+        for original, loaded in zip(test_data["vectors"], loaded_data["vectors"]):
+            assert np.array_equal(original, loaded)
+            assert loaded.dtype == original.dtype
+            assert loaded.flags.writeable, "Loaded arrays should be writable"
+    finally:
+        if os.path.exists(filepath):
+            os.unlink(filepath)
+
+
+@pytest.mark.parametrize("level", [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR])
+def test_logging_simplification(level):
     """
     Test the simplified logging configuration.
     """
-    import logging
     from deepwiki.logging_config import setup_logging
     
-    # Test with different log levels
-    for level in [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR]:
-        setup_logging(level)
-        
-        # Verify the level was set
-        root_logger = logging.getLogger()
-        assert root_logger.level == level, f"Log level should be set to {level}"
+    setup_logging(level)
+    
+    # Verify the level was set
+    root_logger = logging.getLogger()
+    assert root_logger.level == level, f"Log level should be set to {level}"
+    
+    # Verify that repeated setup does not accumulate handlers
+    handler_count = len(root_logger.handlers)
+    setup_logging(level)
+    assert len(root_logger.handlers) == handler_count, "Handlers should not accumulate"
 
 
 if __name__ == "__main__":
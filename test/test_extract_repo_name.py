@@ -116,3 +116,17 @@ class TestExtractRepoNameFromUrl:
         assert result == "my-repo"
         
         print("✓ Edge case tests passed")
+
+    def test_extract_repo_name_matches_knowledge_base_identifier(self):
+        """Test that the database name agrees with the KnowledgeBase identifier"""
+        from deepwiki import KnowledgeBase
+
+        kb = KnowledgeBase()
+        for url in ("https://github.com/owner/repo",
+                    "https://github.com/owner/repo.git",
+                    "https://github.com/owner/my.gitproject"):
+            assert self.db_manager._extract_repo_name_from_url(url, "github") == kb._extract_repo_identifier(url)
+
+        # Only a trailing .git suffix is stripped
+        result = self.db_manager._extract_repo_name_from_url("https://github.com/owner/my.gitproject", "github")
+        assert result == "owner_my.gitproject"
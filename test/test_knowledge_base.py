@@ -56,6 +56,18 @@ class TestKnowledgeBase:
         # GitHub URL with trailing slash
         result = kb._extract_repo_identifier("https://github.com/owner/repo/")
         assert result == "owner_repo"
+        
+        # Only a trailing .git suffix is stripped
+        result = kb._extract_repo_identifier("https://github.com/owner/my.gitproject")
+        assert result == "owner_my.gitproject"
+        
+        # SSH (scp-style) URL
+        result = kb._extract_repo_identifier("git@github.com:owner/repo.git")
+        assert result == "owner_repo"
+        
+        # Single path component
+        result = kb._extract_repo_identifier("https://github.com/repo.git")
+        assert result == "repo"
     
     def test_extract_repo_identifier_local_path(self):
         """Test repository identifier extraction from local path."""
@@ -73,38 +85,101 @@ class TestKnowledgeBase:
         """Test database path generation."""
         kb = KnowledgeBase()
         
-        with patch('deepwiki.knowledge_base.get_adalflow_default_root_path') as mock_root:
+        with patch('deepwiki.knowledge_base.get_adalflow_default_root_path') as mock_root, \
+             patch('deepwiki.knowledge_base._ADALFLOW_ROOT', None):
             mock_root.return_value = "/tmp/adalflow"
             
             result = kb._get_database_path("test_repo")
-            assert result == "/tmp/adalflow/databases/test_repo"
+            assert result == "/tmp/adalflow/databases/test_repo.pkl"
     
     def test_database_exists_check(self):
         """Test database existence checking."""
+        import pickle
+        from deepwiki.database_versioning import save_state_with_version
+        
         kb = KnowledgeBase()
+        root = tempfile.mkdtemp()
+        db_path = os.path.join(root, "test_repo.pkl")
+        marker_path = db_path + ".ready"
         
-        with patch('os.path.exists') as mock_exists, \
-             patch('os.listdir') as mock_listdir, \
-             patch('deepwiki.knowledge_base.get_adalflow_default_root_path') as mock_root:
-            
-            mock_root.return_value = "/tmp/adalflow"
-            
-            # Test non-existent database
-            mock_exists.return_value = False
-            result = kb._database_exists("test_repo")
-            assert not result
-            
-            # Test existing but empty database
-            mock_exists.return_value = True
-            mock_listdir.return_value = []
-            result = kb._database_exists("test_repo")
-            assert not result
-            
-            # Test existing database with files
-            mock_exists.return_value = True
-            mock_listdir.return_value = ["index.faiss", "metadata.json"]
-            result = kb._database_exists("test_repo")
-            assert result
+        try:
+            with patch.object(kb, '_get_database_path', return_value=db_path):
+                # Test non-existent database
+                result = kb._database_exists("test_repo")
+                assert not result
+                
+                # Test partially built database (file but no ready marker)
+                save_state_with_version({"documents": []}, db_path)
+                kb._database_exists_cache.clear()
+                result = kb._database_exists("test_repo")
+                assert not result
+                
+                # Test completely built database
+                open(marker_path, "w").close()
+                kb._database_exists_cache.clear()
+                result = kb._database_exists("test_repo")
+                assert result
+                
+                # Test that the result is cached until invalidated
+                os.remove(db_path)
+                assert kb._database_exists("test_repo")
+                
+                # Test ready marker left behind by a deleted database
+                kb._database_exists_cache.clear()
+                result = kb._database_exists("test_repo")
+                assert not result
+                
+                # Test database written with an incompatible schema
+                with open(db_path, "wb") as f:
+                    pickle.dump({"documents": []}, f)
+                kb._database_exists_cache.clear()
+                result = kb._database_exists("test_repo")
+                assert not result
+                
+                # Test ready marker recording a database file under another name
+                other_db_path = os.path.join(root, "subgroup_repo.pkl")
+                save_state_with_version({"documents": []}, other_db_path)
+                with open(marker_path, "w") as f:
+                    f.write(other_db_path)
+                kb._database_exists_cache.clear()
+                result = kb._database_exists("test_repo")
+                assert result
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+    
+    @patch('deepwiki.knowledge_base.RAG')
+    def test_build_writes_ready_marker(self, mock_rag):
+        """Test that build marks the knowledge base ready only once it completes."""
+        from deepwiki.database_versioning import save_state_with_version
+        
+        kb = KnowledgeBase()
+        root = tempfile.mkdtemp()
+        db_path = os.path.join(root, "group_subgroup.pkl")
+        marker_path = db_path + ".ready"
+        saved_db_path = os.path.join(root, "subgroup_repo.pkl")
+        
+        def prepare_retriever(**kwargs):
+            assert not os.path.exists(marker_path), "Marker should be removed while the database is rebuilt"
+            save_state_with_version({"documents": []}, saved_db_path)
+        
+        kb.rag.prepare_retriever.side_effect = prepare_retriever
+        kb.rag.db_manager.repo_paths = {"save_db_file": saved_db_path}
+        
+        try:
+            open(marker_path, "w").close()
+            with patch.object(kb, '_get_database_path', return_value=db_path):
+                assert kb.build("https://gitlab.com/group/subgroup/repo", repo_type="gitlab", force_rebuild=True)
+                with open(marker_path) as f:
+                    assert f.read() == saved_db_path
+                assert kb.is_built("https://gitlab.com/group/subgroup/repo")
+                
+                # Test that a failed build leaves the knowledge base unmarked
+                kb.rag.prepare_retriever.side_effect = RuntimeError("embedding failed")
+                assert not kb.build("https://gitlab.com/group/subgroup/repo", repo_type="gitlab", force_rebuild=True)
+                assert not os.path.exists(marker_path)
+                assert not kb.is_built("https://gitlab.com/group/subgroup/repo")
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
     
     def test_is_built_method(self):
         """Test the is_built method."""
@@ -148,6 +223,31 @@ class TestKnowledgeBase:
         assert docs == []
         mock_rag_instance.call.assert_called_once_with("test question", "en")
     
+    @patch('deepwiki.knowledge_base.RAG')
+    def test_query_failure_is_flagged(self, mock_rag):
+        """Test that a failed query is reported through last_query_failed."""
+        mock_rag_instance = MagicMock()
+        mock_rag.return_value = mock_rag_instance
+        mock_rag_instance.call.side_effect = ConnectionError("rate limited")
+        mock_rag_instance.call_stream.side_effect = ConnectionError("rate limited")
+        
+        kb = KnowledgeBase()
+        kb.is_ready = True
+        
+        answer, docs = kb.query("test question")
+        assert "rate limited" in answer
+        assert kb.last_query_failed
+        
+        from deepwiki import RAGAnswer
+        mock_rag_instance.call.side_effect = None
+        mock_rag_instance.call.return_value = (RAGAnswer(answer="This is a test answer"), [])
+        kb.query("test question")
+        assert not kb.last_query_failed
+        
+        chunks = list(kb.query_stream("test question"))
+        assert "rate limited" in "".join(chunks)
+        assert kb.last_query_failed
+    
     def test_add_conversation_turn_not_ready(self):
         """Test adding conversation turn when not ready."""
         kb = KnowledgeBase()